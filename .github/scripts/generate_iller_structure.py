@@ -7,9 +7,10 @@ This script reads the main JSON file and creates:
 - PTT/iller/{il_adi}/{ilce_adi}/mahalleler.json - contains list of mahalleler for each il/ilce
 """
 
-import json
 from pathlib import Path
 
+import orjson
+
 
 def sanitize_filename(name):
     """Sanitize filename to remove invalid characters"""
@@ -20,6 +21,24 @@ def sanitize_filename(name):
     return name.strip()
 
 
+def write_json(path, data):
+    """Write data as UTF-8 JSON, formatted like json.dump(..., ensure_ascii=False, indent=4)"""
+    # orjson only indents by 2 spaces. Widen it one nesting level per pass: every line
+    # at this depth or deeper gets 2 more spaces, using plain bytes.replace (strings
+    # never contain raw newlines, so only indentation follows a newline)
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    depth = 1
+    while True:
+        indent = b'\n' + b' ' * (4 * depth - 2)
+        if indent not in content:
+            break
+        content = content.replace(indent, indent + b'  ')
+        depth += 1
+
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
 def generate_iller_structure():
     """Generate folder structure from ptt_il_ilce_mahalle.json"""
     
@@ -30,8 +49,8 @@ def generate_iller_structure():
     
     # Read the main JSON file
     print(f"Reading {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(input_file, 'rb') as f:
+        data = orjson.loads(f.read())
     
     # Create iller directory if it doesn't exist
     iller_dir.mkdir(parents=True, exist_ok=True)
@@ -58,8 +77,7 @@ def generate_iller_structure():
             })
         
         ilceler_file = il_dir / "ilceler.json"
-        with open(ilceler_file, 'w', encoding='utf-8') as f:
-            json.dump(ilceler_data, f, ensure_ascii=False, indent=4)
+        write_json(ilceler_file, ilceler_data)
         
         # Process each ilce
         for ilce in ilceler:
@@ -75,8 +93,7 @@ def generate_iller_structure():
             
             # Create mahalleler.json
             mahalleler_file = ilce_dir / "mahalleler.json"
-            with open(mahalleler_file, 'w', encoding='utf-8') as f:
-                json.dump(mahalleler, f, ensure_ascii=False, indent=4)
+            write_json(mahalleler_file, mahalleler)
         
         print(f"  Created {len(ilceler_data)} ilceler and their mahalleler")
     
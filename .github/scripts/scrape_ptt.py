@@ -2,158 +2,278 @@
 # -*- coding: utf-8 -*-
 
 import re
-import json
-import time
-import html
 import os
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import requests
-from bs4 import BeautifulSoup
+import string
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import hishel
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from hishel.httpx import AsyncCacheTransport
+from selectolax.lexbor import LexborHTMLParser
+
+# Regular expressions, compiled once at import time
+# Neighborhood option text: "<name> / <district> / <postal code>"
+_RE_NEIGHBORHOOD = re.compile(r'(?P<name>[^/]*)(?:/.*?(?P<postal>\d{5}))?')
+_RE_LAST_UPDATED = re.compile(r'(## 📅 Son Güncelleme\s*\n\s*\*\*Son güncelleme:\*\*)[^\n]+')
+
+# Turkish month names, used for the README's last updated date
+TURKISH_MONTHS = (
+    'Ocak', 'Şubat', 'Mart', 'Nisan', 'Mayıs', 'Haziran',
+    'Temmuz', 'Ağustos', 'Eylül', 'Ekim', 'Kasım', 'Aralık'
+)
+
+
+# clean_id tables: path separators become "_", every other byte outside [a-zA-Z0-9_] is deleted
+_ID_SEPARATOR_TABLE = bytes.maketrans(b'\\/', b'__')
+_ID_DELETE_BYTES = bytes(
+    c for c in range(128)
+    if chr(c) not in string.ascii_letters + string.digits + '_\\/'
+)
+
+# Turkish lowercase mapping
+TURKISH_LOWERCASE = {
+    'İ': 'i',
+    'I': 'ı',
+    'Ğ': 'ğ',
+    'Ş': 'ş',
+    'Ç': 'ç',
+    'Ö': 'ö',
+    'Ü': 'ü',
+}
+
+# Translation table for the Turkish-specific mappings; str.lower() handles the rest
+TURKISH_LOWERCASE_TABLE = str.maketrans(TURKISH_LOWERCASE)
+
+
+@functools.lru_cache(maxsize=8192)
+def clean_text(text: str) -> str:
+    """
+    Clean and format text: collapse whitespace and capitalize the first
+    letter of each word (Turkish-aware). HTML entities are expected to be
+    decoded already, as get_options does through selectolax.
+    Example: "İSTANBUL" -> "İstanbul", "KADIKÖY" -> "Kadıköy"
+    """
+    # split() trims and collapses whitespace in the same pass that yields the words.
+    # First character stays uppercase (already is); lowercase the rest,
+    # applying the Turkish mappings before the generic lower()
+    return ' '.join(
+        word[0] + word[1:].translate(TURKISH_LOWERCASE_TABLE).lower()
+        for word in text.split()
+    )
+
+
+def clean_id(id_str: str) -> str:
+    """Clean ID string, replacing special characters."""
+    # Non-ASCII characters are dropped by the encode, the rest in a single translate pass
+    return id_str.encode('ascii', 'ignore').translate(_ID_SEPARATOR_TABLE, _ID_DELETE_BYTES).decode('ascii')
+
+
+def extract_hidden_field(html: str, field_id: str) -> Optional[str]:
+    """
+    Extract the value of an ASP.NET hidden field (rendered as id="..." value="...").
+    Uses plain substring search: __VIEWSTATE can be hundreds of KB, and
+    slicing it out is much cheaper than parsing or regex-scanning the page.
+    """
+    marker = f'{field_id}" value="'
+    start = html.find(marker)
+
+    if start == -1:
+        return None
+
+    start += len(marker)
+    end = html.find('"', start)
+
+    if end == -1:
+        return None
+
+    return html[start:end] or None
+
+
+def get_options(html: str, select_id: str) -> Optional[List[Tuple[str, str]]]:
+    """
+    Extract (value, text) pairs of a dropdown's options, skipping the default (-1) option.
+    Returns None if the dropdown is not on the page.
+    """
+    select = LexborHTMLParser(html).css_first(f'select#{select_id}')
+
+    if select is None:
+        return None
+
+    return [
+        (option.attributes['value'], option.text())
+        for option in select.css('option')
+        if option.attributes.get('value') not in (None, '-1')
+    ]
+
+
+def parse_neighborhoods(neighborhood_html: str) -> List[Dict[str, str]]:
+    """
+    Extract neighborhoods (mahalle) from a district's neighborhood page.
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    """
+    matches = get_options(neighborhood_html, 'MainContent_DropDownList3')
+
+    if not matches:
+        return []
+
+    # get_options already skipped the default option, so the final length is known
+    neighborhoods = [None] * len(matches)
+
+    # Bind globals and methods used in the loop to locals, avoiding repeated lookups
+    _clean_text = clean_text
+    _clean_id = clean_id
+    _match_neighborhood = _RE_NEIGHBORHOOD.match
+
+    for index, (neighborhood_id, neighborhood_name) in enumerate(matches):
+        # Clean the neighborhood name
+        cleaned_name = _clean_text(neighborhood_name)
+
+        # Split off everything after "/" from the name and pick the
+        # postal code (5 digits) out of it in a single match
+        neighborhood_match = _match_neighborhood(cleaned_name)
+        postal_code = neighborhood_match.group('postal')
+        cleaned_name = neighborhood_match.group('name').rstrip()
+
+        # Clean the ID
+        mahalle_id = _clean_id(neighborhood_id)
+
+        neighborhoods[index] = {
+            'mahalle_id': mahalle_id,
+            'mahalle_adi': cleaned_name,
+            'posta_kodu': postal_code,
+        }
 
+    return neighborhoods
 
-class PTTAddressScraper:
-    """Scrapes Turkish address data (il/ilce/mahalle) from PTT website."""
 
-    BASE_URL = 'https://postakodu.ptt.gov.tr'
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport wrapper that throttles the requests it sends with an AsyncLimiter."""
 
-    # Turkish lowercase mapping
-    TURKISH_LOWERCASE = {
-        'İ': 'i',
-        'I': 'ı',
-        'Ğ': 'ğ',
-        'Ş': 'ş',
-        'Ç': 'ç',
-        'Ö': 'ö',
-        'Ü': 'ü',
-    }
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: AsyncLimiter):
+        self.transport = transport
+        self.limiter = limiter
 
-    def __init__(self):
-        """Initialize HTTP session with cookie jar and headers."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-        })
-        self.total_neighborhoods = 0
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self.limiter:
+            return await self.transport.handle_async_request(request)
 
-    def capitalize_first_letter(self, text: str) -> str:
-        """
-        Capitalize first letter of each word, handling Turkish characters.
-        Example: "İSTANBUL" -> "İstanbul", "KADIKÖY" -> "Kadıköy"
-        """
-        words = text.strip().split()
-        capitalized_words = []
+    async def aclose(self):
+        await self.transport.aclose()
 
-        for word in words:
-            if not word:
-                continue
 
-            # Get first character and rest of the word
-            first_char = word[0]
-            rest = word[1:]
+class SuccessfulResponseFilter(hishel.BaseFilter[hishel.Response]):
+    """hishel response filter that only lets 200 OK responses into the cache."""
 
-            # Lowercase the rest, handling Turkish characters
-            rest_lowercased = ''
-            for char in rest:
-                if char in self.TURKISH_LOWERCASE:
-                    rest_lowercased += self.TURKISH_LOWERCASE[char]
-                else:
-                    rest_lowercased += char.lower()
+    def needs_body(self) -> bool:
+        return False
 
-            # First character stays uppercase (already is)
-            capitalized_words.append(first_char + rest_lowercased)
+    def apply(self, item: hishel.Response, body: Optional[bytes]) -> bool:
+        return item.status_code == 200
 
-        return ' '.join(capitalized_words)
 
-    def clean_text(self, text: str) -> str:
-        """Clean and format text, handling HTML entities and Turkish capitalization."""
-        # Decode HTML entities
-        text = html.unescape(text)
+class PTTAddressScraper:
+    """Scrapes Turkish address data (il/ilce/mahalle) from PTT website."""
 
-        # Trim whitespace
-        text = text.strip()
+    BASE_URL = 'https://postakodu.ptt.gov.tr'
 
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
+    # Maximum number of requests in flight at the same time
+    MAX_CONCURRENT_REQUESTS = 8
 
-        # Capitalize first letter of each word (Turkish-aware)
-        text = self.capitalize_first_letter(text)
+    # Requests per second sent to the PTT server, to avoid rate limiting
+    MAX_REQUESTS_PER_SECOND = 5
 
-        return text
+    # On-disk response cache, so reruns within a day don't hit the PTT server again
+    # (hishel keeps it git-ignored by writing a .gitignore into its directory)
+    CACHE_PATH = os.path.join('.cache', 'hishel', 'ptt.db')
+    CACHE_EXPIRE_AFTER = timedelta(days=1)
 
-    def clean_id(self, id_str: str) -> str:
-        """Clean ID string, replacing special characters."""
-        id_str = id_str.replace('\\', '_').replace('/', '_')
-        id_str = re.sub(r'[^a-zA-Z0-9_]', '', id_str)
-        return id_str
+    # Timeout (seconds) for connecting to and reading from the PTT server
+    REQUEST_TIMEOUT = 60
+
+    # Retry policy for transient server and connection errors
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate',
+        'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+    }
+
+    def __init__(self):
+        """Initialize scraper state. The HTTP client and worker pool are created in scrape()."""
+        self.client: Optional[httpx.AsyncClient] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.limiter: Optional[AsyncLimiter] = None
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.total_neighborhoods = 0
 
     def extract_viewstate_and_validation(self, html: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract __VIEWSTATE and __EVENTVALIDATION from HTML."""
-        viewstate_match = re.search(r'__VIEWSTATE" value="([^"]+)"', html)
-        eventvalidation_match = re.search(r'__EVENTVALIDATION" value="([^"]+)"', html)
-
-        viewstate = viewstate_match.group(1) if viewstate_match else None
-        eventvalidation = eventvalidation_match.group(1) if eventvalidation_match else None
+        viewstate = extract_hidden_field(html, '__VIEWSTATE')
+        eventvalidation = extract_hidden_field(html, '__EVENTVALIDATION')
 
         return viewstate, eventvalidation
 
     def get_provinces(self, html: str) -> List[Tuple[str, str]]:
         """Extract provinces (il) from the initial page."""
-        # Match the province dropdown
-        province_match = re.search(
-            r'MainContent_DropDownList1".*?>(.*?)</select>',
-            html,
-            re.DOTALL
-        )
+        provinces = get_options(html, 'MainContent_DropDownList1')
 
-        if not province_match:
+        if provinces is None:
             raise Exception('İl listesi bulunamadı')
 
-        province_select = province_match.group(1)
-
-        # Extract all option values
-        option_pattern = r'<option value="(\d+)">([^<]+)</option>'
-        matches = re.findall(option_pattern, province_select)
-
-        # Filter out the default option (-1)
-        provinces = [(id, name) for id, name in matches if id != '-1']
-
         return provinces
 
     def get_districts(self, province_id: str, html: str) -> List[Tuple[str, str]]:
         """Extract districts (ilce) for a given province."""
-        # Match the district dropdown
-        district_match = re.search(
-            r'MainContent_DropDownList2".*?>(.*?)</select>',
-            html,
-            re.DOTALL
-        )
-
-        if not district_match:
-            return []
-
-        district_select = district_match.group(1)
-
-        # Extract all option values
-        option_pattern = r'<option value="(\d+)">([^<]+)</option>'
-        matches = re.findall(option_pattern, district_select)
-
-        # Filter out the default option (-1)
-        districts = [(id, name) for id, name in matches if id != '-1']
+        return get_options(html, 'MainContent_DropDownList2') or []
 
-        return districts
-
-    def get_neighborhoods(
+    async def fetch(self, form_data: Optional[Dict[str, str]] = None) -> str:
+        """
+        GET the base page, or POST form_data to it, and return the response HTML.
+        Transient failures are retried with exponential backoff.
+        """
+        method = 'GET' if form_data is None else 'POST'
+
+        async with self.semaphore:
+            for attempt in range(self.MAX_RETRIES + 1):
+                try:
+                    response = await self.client.request(method, self.BASE_URL, data=form_data)
+                    response.raise_for_status()
+                    # PTT pages are UTF-8; decoding the raw bytes explicitly skips
+                    # Content-Type parsing and any charset detection on the body
+                    page_html = response.content.decode('utf-8', 'replace')
+                    break
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                        raise
+                except httpx.TransportError:
+                    if attempt == self.MAX_RETRIES:
+                        raise
+
+                await asyncio.sleep(self.RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+        return page_html
+
+    async def get_neighborhoods(
         self,
         province_id: str,
         district_id: str,
-        district_html: str
+        viewstate: Optional[str],
+        eventvalidation: Optional[str]
     ) -> List[Dict[str, str]]:
-        """Get neighborhoods (mahalle) for a given district."""
-        viewstate, eventvalidation = self.extract_viewstate_and_validation(district_html)
-
+        """
+        Get neighborhoods (mahalle) for a given district, using the viewstate and
+        eventvalidation of its province's district page.
+        """
         if not viewstate or not eventvalidation:
             return []
 
@@ -167,66 +287,65 @@ class PTTAddressScraper:
             'ctl00$MainContent$DropDownList2': district_id,
         }
 
-        response = self.session.post(self.BASE_URL, data=form_data)
-        response.raise_for_status()
-        neighborhood_html = response.text
-
-        # Match the neighborhood dropdown
-        neighborhood_match = re.search(
-            r'MainContent_DropDownList3".*?>(.*?)</select>',
-            neighborhood_html,
-            re.DOTALL
-        )
-
-        if not neighborhood_match:
-            return []
-
-        neighborhood_select = neighborhood_match.group(1)
-
-        # Extract all option values
-        option_pattern = r'<option value="([^"]+)">([^<]+)</option>'
-        matches = re.findall(option_pattern, neighborhood_select)
-
-        neighborhoods = []
-        district_source_id = f"{province_id}_{district_id}"
-
-        for neighborhood_id, neighborhood_name in matches:
-            if neighborhood_id == '-1':
-                continue
-
-            # Clean the neighborhood name
-            cleaned_name = self.clean_text(neighborhood_name)
+        neighborhood_html = await self.fetch(form_data)
 
-            # Extract postal code (5 digits)
-            postal_code_match = re.search(r'(\d{5})', cleaned_name)
-            postal_code = postal_code_match.group(1) if postal_code_match else None
+        # Parse in a worker process, so parsing overlaps with the other districts' requests
+        loop = asyncio.get_running_loop()
+        neighborhoods = await loop.run_in_executor(self.pool, parse_neighborhoods, neighborhood_html)
 
-            # Remove postal code and everything after "/" from name
-            cleaned_name = re.sub(r'\s*/\s*.*$', '', cleaned_name)
+        self.total_neighborhoods += len(neighborhoods)
 
-            # Clean the ID
-            mahalle_id = self.clean_id(neighborhood_id)
-
-            neighborhoods.append({
-                'mahalle_id': mahalle_id,
-                'mahalle_adi': cleaned_name,
-                'posta_kodu': postal_code,
-            })
+        return neighborhoods
 
-            self.total_neighborhoods += 1
+    async def scrape(self) -> AsyncIterator[Dict]:
+        """Main scraping method that orchestrates the entire process, yielding each province as it completes."""
+        self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self.limiter = AsyncLimiter(self.MAX_REQUESTS_PER_SECOND, time_period=1)
+
+        # HTTP/2 multiplexes concurrent requests over one TLS connection
+        # (negotiated via ALPN, falling back to pooled HTTP/1.1 keep-alive connections)
+        network_transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=self.MAX_CONCURRENT_REQUESTS,
+                keepalive_expiry=60,
+            ),
+        )
 
-        return neighborhoods
+        # Cache POSTs too: the request body (viewstate + dropdown values) is the cache key.
+        # Cached responses are served before the rate limiter, so they are never delayed
+        cache_policy = hishel.FilterPolicy(response_filters=[SuccessfulResponseFilter()])
+        cache_policy.use_body_key = True
+        transport = AsyncCacheTransport(
+            next_transport=RateLimitedTransport(network_transport, self.limiter),
+            storage=hishel.AsyncSqliteStorage(
+                database_path=self.CACHE_PATH,
+                default_ttl=self.CACHE_EXPIRE_AFTER.total_seconds(),
+            ),
+            policy=cache_policy,
+        )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method that orchestrates the entire process."""
+        # CPU-bound HTML parsing runs in worker processes (one per CPU by default).
+        # Workers are spawned rather than forked: hishel's sqlite storage already runs a
+        # worker thread here, and forking a multi-threaded process can deadlock
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as pool:
+            async with httpx.AsyncClient(
+                transport=transport,
+                headers=self.HEADERS,
+                timeout=self.REQUEST_TIMEOUT,
+            ) as client:
+                self.client = client
+                self.pool = pool
+                async for province in self.scrape_provinces():
+                    yield province
+
+    async def scrape_provinces(self) -> AsyncIterator[Dict]:
+        """Walk every province and fetch its districts' neighborhoods concurrently."""
         print("PTT Adres Verisi Çekme İşlemi Başlatılıyor")
 
-        address_data = []
-
         # Get initial page
-        response = self.session.get(self.BASE_URL)
-        response.raise_for_status()
-        html = response.text
+        html = await self.fetch()
 
         # Get all provinces
         provinces = self.get_provinces(html)
@@ -242,7 +361,7 @@ class PTTAddressScraper:
 
         # Process each province
         for province_index, (province_id, province_name_raw) in enumerate(provinces, 1):
-            province_name = self.clean_text(province_name_raw)
+            province_name = clean_text(province_name_raw)
 
             print(f"\n[{province_index}/{total_provinces}] {province_name} ili işleniyor...")
 
@@ -255,11 +374,9 @@ class PTTAddressScraper:
                 'ctl00$MainContent$DropDownList1': province_id,
             }
 
-            response = self.session.post(self.BASE_URL, data=form_data)
-            response.raise_for_status()
-            district_html = response.text
+            district_html = await self.fetch(form_data)
 
-            # Update viewstate and eventvalidation for next requests
+            # Update viewstate and eventvalidation for the district requests and the next province
             viewstate, eventvalidation = self.extract_viewstate_and_validation(district_html)
 
             # Get districts for this province
@@ -274,18 +391,20 @@ class PTTAddressScraper:
                 'ilceler': [],
             }
 
-            # Process each district
-            for district_index, (district_id, district_name_raw) in enumerate(districts, 1):
-                district_name = self.clean_text(district_name_raw)
+            # Fetch neighborhoods of all districts concurrently; every district
+            # request reuses the viewstate of this province's district_html
+            district_neighborhoods = await asyncio.gather(*(
+                self.get_neighborhoods(province_id, district_id, viewstate, eventvalidation)
+                for district_id, _ in districts
+            ))
 
-                print(f"  [{district_index}/{total_districts}] {district_name} ilçesi işleniyor...")
+            # Process each district
+            for district_index, ((district_id, district_name_raw), neighborhoods) in enumerate(
+                zip(districts, district_neighborhoods), 1
+            ):
+                district_name = clean_text(district_name_raw)
 
-                # Get neighborhoods for this district
-                neighborhoods = self.get_neighborhoods(
-                    province_id,
-                    district_id,
-                    district_html
-                )
+                print(f"  [{district_index}/{total_districts}] {district_name} ilçesi: {len(neighborhoods)} mahalle")
 
                 current_province['ilceler'].append({
                     'ilce_id': district_id,
@@ -293,31 +412,18 @@ class PTTAddressScraper:
                     'mahalleler': neighborhoods,
                 })
 
-                # Update the address data
-                if not address_data:
-                    address_data.append(current_province)
-                else:
-                    last_index = len(address_data) - 1
-                    if address_data[last_index]['il_id'] == province_id:
-                        address_data[last_index] = current_province
-                    else:
-                        address_data.append(current_province)
-
-                # Small delay to avoid rate limiting
-                time.sleep(1)
-
-            # Delay between provinces
-            time.sleep(2)
+            yield current_province
 
             # Note: viewstate and eventvalidation will be extracted from the next province's district_html
 
         print(f"\n\nİşlem tamamlandı!")
         print(f"Toplam {total_provinces} il ve {self.total_neighborhoods} mahalle verisi çekildi.")
 
-        return address_data
-
-    def save_to_file(self, data: List[Dict], filename: str):
-        """Save data to JSON file with UTF-8 encoding."""
+    async def save_to_file(self, provinces: AsyncIterator[Dict], filename: str):
+        """
+        Stream provinces to a JSON file with UTF-8 encoding as they are scraped,
+        so only one province is held in memory at a time.
+        """
         # Create PTT directory if it doesn't exist
         ptt_dir = 'PTT'
         os.makedirs(ptt_dir, exist_ok=True)
@@ -325,13 +431,30 @@ class PTTAddressScraper:
         # Join the directory path with the filename
         filepath = os.path.join(ptt_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(
-                data,
-                f,
-                ensure_ascii=False,
-                indent=2
-            )
+        # Write to a temporary file first so an interrupted run leaves the old data intact
+        tmp_filepath = f'{filepath}.tmp'
+
+        # Output is byte-identical to json.dump(data, ensure_ascii=False, indent=2):
+        # each province is dumped on its own and indented one level as an array element
+        try:
+            with open(tmp_filepath, 'wb') as f:
+                f.write(b'[')
+                separator = b'\n  '
+
+                async for province in provinces:
+                    province_json = orjson.dumps(province, option=orjson.OPT_INDENT_2)
+                    f.write(separator + province_json.replace(b'\n', b'\n  '))
+                    separator = b',\n  '
+
+                # An empty list is written as "[]"
+                f.write(b'\n]' if separator == b',\n  ' else b']')
+
+            os.replace(tmp_filepath, filepath)
+        except BaseException:
+            # Don't leave a half-written file next to the data if scraping fails
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            raise
 
     def update_readme(self, readme_path: str = 'README.md'):
         """Update README with last updated date."""
@@ -346,19 +469,12 @@ class PTTAddressScraper:
         # Get current date and time in Turkish format
         now = datetime.now()
         # Format: "15 Ocak 2024, 14:30" (Turkish month names)
-        turkish_months = [
-            'Ocak', 'Şubat', 'Mart', 'Nisan', 'Mayıs', 'Haziran',
-            'Temmuz', 'Ağustos', 'Eylül', 'Ekim', 'Kasım', 'Aralık'
-        ]
-        formatted_date = f"{now.day} {turkish_months[now.month - 1]} {now.year}, {now.hour:02d}:{now.minute:02d}"
+        formatted_date = f"{now.day} {TURKISH_MONTHS[now.month - 1]} {now.year}, {now.hour:02d}:{now.minute:02d}"
 
         # Replace the date in the last updated section
-        last_updated_pattern = r'(## 📅 Son Güncelleme\s*\n\s*\*\*Son güncelleme:\*\*)[^\n]+'
-        readme_content = re.sub(
-            last_updated_pattern,
+        readme_content = _RE_LAST_UPDATED.sub(
             f'\\1 {formatted_date}',
-            readme_content,
-            flags=re.MULTILINE
+            readme_content
         )
 
         # Write updated README
@@ -373,13 +489,10 @@ def main():
     scraper = PTTAddressScraper()
 
     try:
-        # Scrape the data
-        address_data = scraper.scrape()
-
         filename = f'ptt_il_ilce_mahalle.json'
 
-        # Save to file
-        scraper.save_to_file(address_data, filename)
+        # Scrape the data, saving each province to file as soon as it is scraped
+        asyncio.run(scraper.save_to_file(scraper.scrape(), filename))
 
         print(f"\nVeriler PTT/{filename} dosyasına kaydedildi.")
 